@@ -2,6 +2,7 @@ import asyncio
 import importlib
 import importlib.util
 import os
+from typing import Any
 
 import structlog
 from starlette.applications import Starlette
@@ -9,24 +10,41 @@ from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, Response
 from starlette.routing import BaseRoute, Mount, Route
 
-from langgraph_api.api.assistants import assistants_routes
-from langgraph_api.api.meta import meta_info, meta_metrics
-from langgraph_api.api.openapi import get_openapi_spec
-from langgraph_api.api.runs import runs_routes
-from langgraph_api.api.store import store_routes
-from langgraph_api.api.threads import threads_routes
-from langgraph_api.auth.middleware import auth_middleware
-from langgraph_api.config import HTTP_CONFIG, MIGRATIONS_PATH
-from langgraph_api.graph import js_bg_tasks
-from langgraph_api.validation import DOCS_HTML
-from langgraph_storage.database import connect, healthcheck
+from langgraph_api.config import HTTP_CONFIG
 
 logger = structlog.stdlib.get_logger(__name__)
 
+# Route modules pull in storage, auth and graph machinery, so they are only
+# imported on first access (PEP 562) or when the routes are built.
+_LAZY_ATTRS = {
+    "assistants_routes": "langgraph_api.api.assistants",
+    "meta_info": "langgraph_api.api.meta",
+    "meta_metrics": "langgraph_api.api.meta",
+    "get_openapi_spec": "langgraph_api.api.openapi",
+    "runs_routes": "langgraph_api.api.runs",
+    "store_routes": "langgraph_api.api.store",
+    "threads_routes": "langgraph_api.api.threads",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("routes", "user_router", "protected_routes"):
+        _build_routes()
+        return globals()[name]
+    if module := _LAZY_ATTRS.get(name):
+        value = getattr(importlib.import_module(module), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 async def ok(request: Request):
+    from langgraph_api.graph import js_bg_tasks
+    from langgraph_storage.database import healthcheck
+
     check_db = int(request.query_params.get("check_db", "0"))
     logger.info(f"Received /ok request, check_db={check_db}")
-    
+
     if check_db:
         await healthcheck()
         logger.info("Database health check completed successfully")
@@ -38,59 +56,79 @@ async def ok(request: Request):
 
     return JSONResponse({"ok": True})
 
+_OPENAPI_CACHE: bytes | None = None
+
+
 async def openapi(request: Request):
+    global _OPENAPI_CACHE
     logger.info("Received request for OpenAPI spec")
-    spec = await asyncio.to_thread(get_openapi_spec)
-    return Response(spec, media_type="application/json")
+    # the spec is static once graphs are registered, so only build and encode
+    # it once, instead of encoding the str on every response
+    if _OPENAPI_CACHE is None:
+        from langgraph_api.api.openapi import get_openapi_spec
+
+        _OPENAPI_CACHE = (await asyncio.to_thread(get_openapi_spec)).encode()
+    return Response(_OPENAPI_CACHE, media_type="application/json")
 
 async def docs(request: Request):
+    from langgraph_api.validation import DOCS_HTML
+
     logger.info("Received request for API documentation")
     return HTMLResponse(DOCS_HTML)
 
-# Define meta routes
-meta_routes: list[BaseRoute] = [
-    Route("/ok", ok, methods=["GET"]),
-    Route("/openapi.json", openapi, methods=["GET"]),
-    Route("/docs", docs, methods=["GET"]),
-    Route("/info", meta_info, methods=["GET"]),
-    Route("/metrics", meta_metrics, methods=["GET"]),
-]
 
-logger.debug("Meta routes initialized", meta_routes=[route.path for route in meta_routes])
+def _meta_routes() -> list[BaseRoute]:
+    from langgraph_api.api.meta import meta_info, meta_metrics
 
-protected_routes: list[BaseRoute] = []
+    meta_routes: list[BaseRoute] = [
+        Route("/ok", ok, methods=["GET"]),
+        Route("/openapi.json", openapi, methods=["GET"]),
+        Route("/docs", docs, methods=["GET"]),
+        Route("/info", meta_info, methods=["GET"]),
+        Route("/metrics", meta_metrics, methods=["GET"]),
+    ]
+    logger.debug("Meta routes initialized", meta_routes=[route.path for route in meta_routes])
+    return meta_routes
 
-# Configure protected routes based on HTTP_CONFIG
-if HTTP_CONFIG:
-    logger.info("Processing HTTP_CONFIG for protected routes")
 
-    if not HTTP_CONFIG.get("disable_assistants"):
+def _protected_routes() -> list[BaseRoute]:
+    """Import and collect the route modules that are not disabled in HTTP_CONFIG."""
+    protected_routes: list[BaseRoute] = []
+
+    # Configure protected routes based on HTTP_CONFIG
+    if HTTP_CONFIG:
+        logger.info("Processing HTTP_CONFIG for protected routes")
+    else:
+        logger.warning("No HTTP_CONFIG found, enabling all default routes")
+    http_config = HTTP_CONFIG or {}
+
+    if not http_config.get("disable_assistants"):
+        from langgraph_api.api.assistants import assistants_routes
+
         protected_routes.extend(assistants_routes)
         logger.debug("Added assistant routes")
 
-    if not HTTP_CONFIG.get("disable_runs"):
+    if not http_config.get("disable_runs"):
+        from langgraph_api.api.runs import runs_routes
+
         protected_routes.extend(runs_routes)
         logger.debug("Added runs routes")
 
-    if not HTTP_CONFIG.get("disable_threads"):
+    if not http_config.get("disable_threads"):
+        from langgraph_api.api.threads import threads_routes
+
         protected_routes.extend(threads_routes)
         logger.debug("Added threads routes")
 
-    if not HTTP_CONFIG.get("disable_store"):
+    if not http_config.get("disable_store"):
+        from langgraph_api.api.store import store_routes
+
         protected_routes.extend(store_routes)
         logger.debug("Added store routes")
 
-else:
-    logger.warning("No HTTP_CONFIG found, enabling all default routes")
-    protected_routes.extend(assistants_routes)
-    protected_routes.extend(runs_routes)
-    protected_routes.extend(threads_routes)
-    protected_routes.extend(store_routes)
+    logger.debug("Protected routes initialized", protected_routes=[route.path for route in protected_routes])
+    return protected_routes
 
-logger.debug("Protected routes initialized", protected_routes=[route.path for route in protected_routes])
-
-routes: list[BaseRoute] = []
-user_router = None
 
 def load_custom_app(app_import: str) -> Starlette | None:
     logger.info(f"Attempting to load custom app from {app_import}")
@@ -127,7 +165,33 @@ def load_custom_app(app_import: str) -> Starlette | None:
 
     return user_router
 
-# Initialize routes based on configuration
-if HTTP_CONFIG:
-    if router_import := HTTP_CONFIG.get("app"):
-        user
+
+def _build_routes() -> None:
+    """Build `routes`, `protected_routes` and `user_router` once, on first access."""
+    global routes, protected_routes, user_router
+    if "routes" in globals():
+        return
+
+    from langgraph_api.auth.middleware import auth_middleware
+
+    _routes: list[BaseRoute] = []
+    _user_router: Starlette | None = None
+    _protected = _protected_routes()
+
+    # Initialize routes based on configuration
+    if HTTP_CONFIG:
+        if router_import := HTTP_CONFIG.get("app"):
+            _user_router = load_custom_app(router_import)
+        if not HTTP_CONFIG.get("disable_meta"):
+            _routes.extend(_meta_routes())
+        if _protected:
+            _routes.append(
+                Mount("/", middleware=[auth_middleware], routes=_protected)
+            )
+    else:
+        _routes.extend(_meta_routes())
+        _routes.append(Mount("/", middleware=[auth_middleware], routes=_protected))
+
+    protected_routes = _protected
+    user_router = _user_router
+    routes = _routes
@@ -1,14 +1,19 @@
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Coroutine, Mapping
+from functools import partial
+from typing import Any
+from uuid import UUID
 
-import orjson
+import structlog
 from langgraph.checkpoint.base.id import uuid6
 from starlette.responses import Response, StreamingResponse
 
 from langgraph_api import config
-from langgraph_api.asyncio import ValueEvent, aclosing
-from langgraph_api.models.run import create_valid_run
+from langgraph_api.asyncio import aclosing
+from langgraph_api.models.run import create_valid_run, create_valid_stateless_runs
 from langgraph_api.route import ApiRequest, ApiResponse, ApiRoute
+from langgraph_api.schema import Run
+from langgraph_api.serde import json_dumpb
 from langgraph_api.sse import EventSourceResponse
 from langgraph_api.utils import fetchone, validate_uuid
 from langgraph_api.validation import (
@@ -20,13 +25,59 @@ from langgraph_api.validation import (
 )
 from langgraph_license.validation import plus_features_enabled
 from langgraph_storage.database import connect
-from langgraph_storage.ops import Crons, Runs, Threads
+from langgraph_storage.ops import Crons, Runs, StreamSubscription, Threads
 from langgraph_storage.retry import retry_db
-import logging
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger(__name__)
+logger = structlog.stdlib.get_logger(__name__)
+
+KEEPALIVE_INTERVAL = 5  # seconds
+_TRUTHY = frozenset(("true", "yes", "1"))
+_CANCEL_ACTIONS = frozenset(("interrupt", "rollback"))
+
+
+async def keepalive_body(
+    consume: Callable[[], Coroutine[Any, Any, bytes | None]],
+) -> AsyncIterator[bytes]:
+    """Yield the result of `consume()`, keeping the connection open meanwhile by
+    sending whitespace every 5 seconds. Leading whitespace will be ignored by
+    json parsers."""
+    loop = asyncio.get_running_loop()
+    # (is_final, chunk) pairs; at most one heartbeat is ever queued
+    chunks: asyncio.Queue[tuple[bool, bytes | None]] = asyncio.Queue()
+
+    def heartbeat() -> None:
+        nonlocal handle
+        if chunks.empty():
+            chunks.put_nowait((False, b"\n"))
+        handle = loop.call_later(KEEPALIVE_INTERVAL, heartbeat)
+
+    def on_done(task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        if exc := task.exception():
+            logger.error("Error consuming run stream", exc_info=exc)
+            # same shape as the error chunks of a failed run
+            chunks.put_nowait((True, json_dumpb({"__error__": str(exc)})))
+        else:
+            chunks.put_nowait((True, task.result()))
+
+    handle = loop.call_later(KEEPALIVE_INTERVAL, heartbeat)
+    stream = asyncio.create_task(consume())
+    stream.add_done_callback(on_done)
+    try:
+        while True:
+            is_final, chunk = await chunks.get()
+            if chunk is not None:
+                yield chunk
+            if is_final:
+                break
+    except asyncio.CancelledError:
+        stream.cancel()
+        await stream
+        raise
+    finally:
+        handle.cancel()
+
 
 @retry_db
 async def create_run(request: ApiRequest):
@@ -60,23 +111,26 @@ async def create_stateless_run(request: ApiRequest):
 async def create_stateless_run_batch(request: ApiRequest):
     """Create a batch of stateless backround runs."""
     batch_payload = await request.json(RunBatchCreate)
-    async with connect() as conn, conn.pipeline():
-        # barrier so all queries are sent before fetching any results
-        barrier = asyncio.Barrier(len(batch_payload))
-        coros = [
-            create_valid_run(
-                conn,
-                None,
-                payload,
-                request.headers,
-                barrier,
-            )
-            for payload in batch_payload
-        ]
-        runs = await asyncio.gather(*coros)
+    async with connect() as conn:
+        runs = await create_valid_stateless_runs(conn, batch_payload, request.headers)
     return ApiResponse(runs)
 
 
+@retry_db
+async def _create_with_retry(
+    thread_id: str | None,
+    payload: dict,
+    headers: Mapping[str, str],
+    run_id: UUID,
+) -> Run:
+    """Create a run, retrying only the insert.
+
+    Streaming handlers must not be wrapped in `retry_db` as a whole, since a
+    partially sent response can't be restarted."""
+    async with connect() as conn:
+        return await create_valid_run(conn, thread_id, payload, headers, run_id=run_id)
+
+
 async def stream_run(
     request: ApiRequest,
 ):
@@ -85,21 +139,12 @@ async def stream_run(
     payload = await request.json(RunCreateStateful)
     on_disconnect = payload.get("on_disconnect", "continue")
     run_id = uuid6()
-    sub = asyncio.create_task(Runs.Stream.subscribe(run_id))
+    sub = Runs.Stream.prearm(run_id)
 
     try:
-        async with connect() as conn:
-            run = await create_valid_run(
-                conn,
-                thread_id,
-                payload,
-                request.headers,
-                run_id=run_id,
-            )
+        run = await _create_with_retry(thread_id, payload, request.headers, run_id)
     except Exception:
-        if not sub.cancelled():
-            handle = await sub
-            await handle.__aexit__(None, None, None)
+        sub.cancel()
         raise
 
     return EventSourceResponse(
@@ -107,7 +152,7 @@ async def stream_run(
             run["run_id"],
             thread_id=thread_id,
             cancel_on_disconnect=on_disconnect == "cancel",
-            stream_mode=await sub,
+            stream_mode=sub,
         ),
         headers={
             "Location": f"/threads/{thread_id}/runs/{run['run_id']}/stream",
@@ -124,21 +169,12 @@ async def stream_run_stateless(
     payload = await request.json(RunCreateStateless)
     on_disconnect = payload.get("on_disconnect", "continue")
     run_id = uuid6()
-    sub = asyncio.create_task(Runs.Stream.subscribe(run_id))
+    sub = Runs.Stream.prearm(run_id)
 
     try:
-        async with connect() as conn:
-            run = await create_valid_run(
-                conn,
-                None,
-                payload,
-                request.headers,
-                run_id=run_id,
-            )
+        run = await _create_with_retry(None, payload, request.headers, run_id)
     except Exception:
-        if not sub.cancelled():
-            handle = await sub
-            await handle.__aexit__(None, None, None)
+        sub.cancel()
         raise
 
     return EventSourceResponse(
@@ -147,7 +183,7 @@ async def stream_run_stateless(
             thread_id=run["thread_id"],
             ignore_404=True,
             cancel_on_disconnect=on_disconnect == "cancel",
-            stream_mode=await sub,
+            stream_mode=sub,
         ),
         headers={
             "Location": f"/threads/{run['thread_id']}/runs/{run['run_id']}/stream",
@@ -157,62 +193,37 @@ async def stream_run_stateless(
     )
 
 
-@retry_db
+async def _join_last_chunk(run: Run, sub: StreamSubscription) -> bytes | None:
+    """Drain the run's stream, returning only the last values or error chunk."""
+    last_mode: bytes | None = None
+    last_chunk: bytes | None = None
+    # join is an async generator, aclosing closes its pubsub on early exit
+    async with aclosing(
+        Runs.Stream.join(run["run_id"], thread_id=run["thread_id"], stream_mode=sub)
+    ) as stream:
+        async for mode, chunk in stream:
+            if mode == b"values" or mode == b"error":
+                last_mode, last_chunk = mode, chunk
+    if last_mode == b"error":
+        return b'{"__error__":' + last_chunk + b"}"
+    return last_chunk
+
+
 async def wait_run(request: ApiRequest):
     """Create a run, wait for the output."""
     thread_id = request.path_params["thread_id"]
     payload = await request.json(RunCreateStateful)
     run_id = uuid6()
-    sub = asyncio.create_task(Runs.Stream.subscribe(run_id))
+    sub = Runs.Stream.prearm(run_id)
 
     try:
-        async with connect() as conn:
-            run = await create_valid_run(
-                conn,
-                thread_id,
-                payload,
-                request.headers,
-                run_id=run_id,
-            )
+        run = await _create_with_retry(thread_id, payload, request.headers, run_id)
     except Exception:
-        if not sub.cancelled():
-            handle = await sub
-            await handle.__aexit__(None, None, None)
+        sub.cancel()
         raise
 
-    last_chunk = ValueEvent()
-
-    async def consume():
-        vchunk: bytes | None = None
-        async with aclosing(
-            Runs.Stream.join(
-                run["run_id"], thread_id=run["thread_id"], stream_mode=await sub
-            )
-        ) as stream:
-            async for mode, chunk in stream:
-                if mode == b"values":
-                    vchunk = chunk
-                elif mode == b"error":
-                    vchunk = orjson.dumps({"__error__": orjson.Fragment(chunk)})
-            last_chunk.set(vchunk)
-
-    # keep the connection open by sending whitespace every 5 seconds
-    # leading whitespace will be ignored by json parsers
-    async def body() -> AsyncIterator[bytes]:
-        stream = asyncio.create_task(consume())
-        while True:
-            try:
-                yield await asyncio.wait_for(last_chunk.wait(), timeout=5)
-                break
-            except TimeoutError:
-                yield b"\n"
-            except asyncio.CancelledError:
-                stream.cancel()
-                await stream
-                raise
-
     return StreamingResponse(
-        body(),
+        keepalive_body(partial(_join_last_chunk, run, sub)),
         media_type="application/json",
         headers={
             "Location": f"/threads/{thread_id}/runs/{run['run_id']}/join",
@@ -221,79 +232,22 @@ async def wait_run(request: ApiRequest):
         },
     )
 
-@retry_db
+
 async def wait_run_stateless(request: ApiRequest):
     """Create a stateless run, wait for the output."""
-    logger.info("Received request for stateless run")
-
     payload = await request.json(RunCreateStateless)
-    logger.debug(f"Parsed request payload: {payload}")
-
     run_id = uuid6()
-    logger.debug(f"Generated run ID: {run_id}")
+    sub = Runs.Stream.prearm(run_id)
 
-    sub = asyncio.create_task(Runs.Stream.subscribe(run_id))
-    
     try:
-        async with connect() as conn:
-            logger.info("Connected to database")
-            run = await create_valid_run(
-                conn,
-                None,
-                payload,
-                request.headers,
-                run_id=run_id,
-            )
-            logger.debug(f"Created valid run: {run}")
-    except Exception as e:
-        logger.error(f"Exception while creating run: {e}", exc_info=True)
-        if not sub.cancelled():
-            handle = await sub
-            await handle.__aexit__(None, None, None)
+        run = await _create_with_retry(None, payload, request.headers, run_id)
+    except Exception:
+        logger.exception("Failed to create stateless run", run_id=str(run_id))
+        sub.cancel()
         raise
 
-    last_chunk = ValueEvent()
-
-    async def consume():
-        logger.info("Started consuming stream data")
-        vchunk: bytes | None = None
-        try:
-            async with aclosing(
-                Runs.Stream.join(
-                    run["run_id"], thread_id=run["thread_id"], stream_mode=await sub
-                )
-            ) as stream:
-                async for mode, chunk in stream:
-                    if mode == b"values":
-                        vchunk = chunk
-                        logger.debug("Received value chunk")
-                    elif mode == b"error":
-                        vchunk = orjson.dumps({"__error__": orjson.Fragment(chunk)})
-                        logger.warning("Received error chunk")
-            last_chunk.set(vchunk)
-        except Exception as e:
-            logger.error(f"Error in consuming stream: {e}", exc_info=True)
-
-    async def body() -> AsyncIterator[bytes]:
-        """Keep the connection open by sending whitespace every 5 seconds."""
-        stream = asyncio.create_task(consume())
-        logger.info("Started streaming response body")
-        while True:
-            try:
-                yield await asyncio.wait_for(last_chunk.wait(), timeout=5)
-                logger.debug("Chunk sent to client")
-                break
-            except TimeoutError:
-                logger.warning("Timeout waiting for chunk, sending keep-alive")
-                yield b"\n"
-            except asyncio.CancelledError:
-                logger.info("Stream task cancelled")
-                stream.cancel()
-                await stream
-                raise
-
-    response = StreamingResponse(
-        body(),
+    return StreamingResponse(
+        keepalive_body(partial(_join_last_chunk, run, sub)),
         media_type="application/json",
         headers={
             "Location": f"/threads/{run['thread_id']}/runs/{run['run_id']}/join",
@@ -301,9 +255,6 @@ async def wait_run_stateless(request: ApiRequest):
             "X-Accel-Buffering": "no",  # Sometimes helps Vercel/CDNs stream properly
         },
     )
-    logger.info("Returning streaming response")
-    
-    return response
 
 
 @retry_db
@@ -312,25 +263,19 @@ async def list_runs_http(
 ):
     """List all runs for a thread."""
     thread_id = request.path_params["thread_id"]
-    validate_uuid(thread_id, "Invalid thread ID: must be a UUID")
     limit = int(request.query_params.get("limit", 10))
     offset = int(request.query_params.get("offset", 0))
     status = request.query_params.get("status")
 
-    async with connect() as conn, conn.pipeline():
-        thread, runs = await asyncio.gather(
-            Threads.get(conn, thread_id),
-            Runs.search(
-                conn,
-                thread_id,
-                limit=limit,
-                offset=offset,
-                status=status,
-                metadata=None,
-            ),
+    async with connect() as conn:
+        runs = await Threads.get_with_runs(
+            conn,
+            thread_id,
+            limit=limit,
+            offset=offset,
+            status=status,
         )
-    await fetchone(thread)
-    return ApiResponse([run async for run in runs])
+        return ApiResponse([run async for run in runs])
 
 
 @retry_db
@@ -338,20 +283,15 @@ async def get_run_http(request: ApiRequest):
     """Get a run by ID."""
     thread_id = request.path_params["thread_id"]
     run_id = request.path_params["run_id"]
-    validate_uuid(thread_id, "Invalid thread ID: must be a UUID")
-    validate_uuid(run_id, "Invalid run ID: must be a UUID")
-
-    async with connect() as conn, conn.pipeline():
-        thread, run = await asyncio.gather(
-            Threads.get(conn, thread_id),
-            Runs.get(
-                conn,
-                run_id,
-                thread_id=thread_id,
-            ),
+
+    async with connect() as conn:
+        # Runs.get joins on thread, so a missing thread is also a 404
+        run = await Runs.get(
+            conn,
+            run_id,
+            thread_id=thread_id,
         )
-    await fetchone(thread)
-    return ApiResponse(await fetchone(run))
+        return ApiResponse(await fetchone(run))
 
 
 @retry_db
@@ -359,8 +299,6 @@ async def join_run(request: ApiRequest):
     """Wait for a run to finish."""
     thread_id = request.path_params["thread_id"]
     run_id = request.path_params["run_id"]
-    validate_uuid(thread_id, "Invalid thread ID: must be a UUID")
-    validate_uuid(run_id, "Invalid run ID: must be a UUID")
 
     return ApiResponse(
         await Runs.join(
@@ -376,9 +314,7 @@ async def join_run_stream_endpoint(request: ApiRequest):
     thread_id = request.path_params["thread_id"]
     run_id = request.path_params["run_id"]
     cancel_on_disconnect_str = request.query_params.get("cancel_on_disconnect", "false")
-    cancel_on_disconnect = cancel_on_disconnect_str.lower() in {"true", "yes", "1"}
-    validate_uuid(thread_id, "Invalid thread ID: must be a UUID")
-    validate_uuid(run_id, "Invalid run ID: must be a UUID")
+    cancel_on_disconnect = cancel_on_disconnect_str.lower() in _TRUTHY
     return EventSourceResponse(
         Runs.Stream.join(
             run_id,
@@ -395,12 +331,10 @@ async def cancel_run(
     """Cancel a run."""
     thread_id = request.path_params["thread_id"]
     run_id = request.path_params["run_id"]
-    validate_uuid(thread_id, "Invalid thread ID: must be a UUID")
-    validate_uuid(run_id, "Invalid run ID: must be a UUID")
-    wait_str = request.query_params.get("wait", False)
-    wait = wait_str.lower() in {"true", "yes", "1"}
+    wait_str = request.query_params.get("wait", "false")
+    wait = wait_str.lower() in _TRUTHY
     action_str = request.query_params.get("action", "interrupt")
-    action = action_str if action_str in {"interrupt", "rollback"} else "interrupt"
+    action = action_str if action_str in _CANCEL_ACTIONS else "interrupt"
 
     async with connect() as conn:
         await Runs.cancel(
@@ -422,8 +356,6 @@ async def delete_run(request: ApiRequest):
     """Delete a run by ID."""
     thread_id = request.path_params["thread_id"]
     run_id = request.path_params["run_id"]
-    validate_uuid(thread_id, "Invalid thread ID: must be a UUID")
-    validate_uuid(run_id, "Invalid run ID: must be a UUID")
 
     async with connect() as conn:
         rid = await Runs.delete(
@@ -455,7 +387,6 @@ async def create_cron(request: ApiRequest):
 async def create_thread_cron(request: ApiRequest):
     """Create a thread specific cron."""
     thread_id = request.path_params["thread_id"]
-    validate_uuid(thread_id, "Invalid thread ID: must be a UUID")
     payload = await request.json(CronCreate)
 
     async with connect() as conn:
@@ -473,7 +404,6 @@ async def create_thread_cron(request: ApiRequest):
 async def delete_cron(request: ApiRequest):
     """Delete a cron by ID."""
     cron_id = request.path_params["cron_id"]
-    validate_uuid(cron_id, "Invalid cron ID: must be a UUID")
 
     async with connect() as conn:
         cid = await Crons.delete(
@@ -509,41 +439,45 @@ runs_routes = [
     ApiRoute("/runs/wait", wait_run_stateless, methods=["POST"]),
     ApiRoute("/runs", create_stateless_run, methods=["POST"]),
     ApiRoute("/runs/batch", create_stateless_run_batch, methods=["POST"]),
-    (
-        ApiRoute("/runs/crons", create_cron, methods=["POST"])
-        if config.FF_CRONS_ENABLED and plus_features_enabled()
-        else None
-    ),
-    (
-        ApiRoute("/runs/crons/search", search_crons, methods=["POST"])
-        if config.FF_CRONS_ENABLED and plus_features_enabled()
-        else None
+    ApiRoute(
+        "/threads/{thread_id:uuid_str}/runs/{run_id:uuid_str}/join",
+        join_run,
+        methods=["GET"],
     ),
-    ApiRoute("/threads/{thread_id}/runs/{run_id}/join", join_run, methods=["GET"]),
     ApiRoute(
-        "/threads/{thread_id}/runs/{run_id}/stream",
+        "/threads/{thread_id:uuid_str}/runs/{run_id:uuid_str}/stream",
         join_run_stream_endpoint,
         methods=["GET"],
     ),
-    ApiRoute("/threads/{thread_id}/runs/{run_id}/cancel", cancel_run, methods=["POST"]),
-    ApiRoute("/threads/{thread_id}/runs/{run_id}", get_run_http, methods=["GET"]),
-    ApiRoute("/threads/{thread_id}/runs/{run_id}", delete_run, methods=["DELETE"]),
-    ApiRoute("/threads/{thread_id}/runs/stream", stream_run, methods=["POST"]),
-    ApiRoute("/threads/{thread_id}/runs/wait", wait_run, methods=["POST"]),
-    ApiRoute("/threads/{thread_id}/runs", create_run, methods=["POST"]),
-    (
-        ApiRoute(
-            "/threads/{thread_id}/runs/crons", create_thread_cron, methods=["POST"]
-        )
-        if config.FF_CRONS_ENABLED and plus_features_enabled()
-        else None
+    ApiRoute(
+        "/threads/{thread_id:uuid_str}/runs/{run_id:uuid_str}/cancel",
+        cancel_run,
+        methods=["POST"],
     ),
-    ApiRoute("/threads/{thread_id}/runs", list_runs_http, methods=["GET"]),
-    (
-        ApiRoute("/runs/crons/{cron_id}", delete_cron, methods=["DELETE"])
-        if config.FF_CRONS_ENABLED and plus_features_enabled()
-        else None
+    ApiRoute(
+        "/threads/{thread_id:uuid_str}/runs/{run_id:uuid_str}",
+        get_run_http,
+        methods=["GET"],
+    ),
+    ApiRoute(
+        "/threads/{thread_id:uuid_str}/runs/{run_id:uuid_str}",
+        delete_run,
+        methods=["DELETE"],
     ),
+    ApiRoute("/threads/{thread_id:uuid_str}/runs/stream", stream_run, methods=["POST"]),
+    ApiRoute("/threads/{thread_id:uuid_str}/runs/wait", wait_run, methods=["POST"]),
+    ApiRoute("/threads/{thread_id:uuid_str}/runs", create_run, methods=["POST"]),
+    ApiRoute("/threads/{thread_id:uuid_str}/runs", list_runs_http, methods=["GET"]),
 ]
 
-runs_routes = [route for route in runs_routes if route is not None]
+if config.FF_CRONS_ENABLED and plus_features_enabled():
+    runs_routes += [
+        ApiRoute("/runs/crons", create_cron, methods=["POST"]),
+        ApiRoute("/runs/crons/search", search_crons, methods=["POST"]),
+        ApiRoute(
+            "/threads/{thread_id:uuid_str}/runs/crons",
+            create_thread_cron,
+            methods=["POST"],
+        ),
+        ApiRoute("/runs/crons/{cron_id:uuid_str}", delete_cron, methods=["DELETE"]),
+    ]
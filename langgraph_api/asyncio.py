@@ -19,6 +19,11 @@ async def sleep_if_not_done(delay: float, done: asyncio.Event) -> None:
 
 
 class ValueEvent(asyncio.Event):
+    def __init__(self) -> None:
+        super().__init__()
+        # a set, so that waiters can be discarded in O(1) on wakeup/cancellation
+        self._waiters: set[asyncio.Future] = set()
+
     def set(self, value: Any = True) -> None:
         """Set the internal flag to true. All coroutines waiting for it to
         become set are awakened. Coroutine that call wait() once the flag is
@@ -42,34 +47,37 @@ class ValueEvent(asyncio.Event):
             return self._value
 
         fut = self._get_loop().create_future()
-        self._waiters.append(fut)
+        self._waiters.add(fut)
         try:
             return await fut
         finally:
-            self._waiters.remove(fut)
+            self._waiters.discard(fut)
 
 
 async def wait_if_not_done(coro: Coroutine[Any, Any, T], done: ValueEvent) -> T:
     """Wait for the coroutine to finish or the event to be set."""
+    coro_task = asyncio.ensure_future(coro)
+    done_task = asyncio.ensure_future(done.wait())
+    done_task.add_done_callback(lambda _: coro_task.cancel(done._value))
+    try:
+        await asyncio.wait((coro_task, done_task), return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        coro_task.cancel()
+        await asyncio.wait((coro_task,))
+        raise
+    finally:
+        done_task.cancel()
     try:
-        async with asyncio.TaskGroup() as tg:
-            coro_task = tg.create_task(coro)
-            done_task = tg.create_task(done.wait())
-            coro_task.add_done_callback(lambda _: done_task.cancel())
-            done_task.add_done_callback(lambda _: coro_task.cancel(done._value))
-            try:
-                return await coro_task
-            except asyncio.CancelledError as e:
-                if e.args and asyncio.isfuture(e.args[-1]):
-                    await logger.ainfo(
-                        "Awaiting future upon cancellation", task=str(e.args[-1])
-                    )
-                    await e.args[-1]
-                if e.args and isinstance(e.args[0], Exception):
-                    raise e.args[0] from None
-                raise
-    except ExceptionGroup as e:
-        raise e.exceptions[0] from None
+        return await coro_task
+    except asyncio.CancelledError as e:
+        if e.args and asyncio.isfuture(e.args[-1]):
+            await logger.ainfo(
+                "Awaiting future upon cancellation", task=str(e.args[-1])
+            )
+            await e.args[-1]
+        if e.args and isinstance(e.args[0], Exception):
+            raise e.args[0] from None
+        raise
 
 
 PENDING_TASKS = set()
@@ -97,6 +105,13 @@ def create_task(
     return task
 
 
+def spawn_all(
+    tg: "asyncio.TaskGroup | SimpleTaskGroup", *coros: Coroutine[Any, Any, Any]
+) -> list[asyncio.Task]:
+    """Start each coroutine as a task in the task group, in order."""
+    return [tg.create_task(coro) for coro in coros]
+
+
 class SimpleTaskGroup(AbstractAsyncContextManager["SimpleTaskGroup"]):
     """An async task group that can be configured to wait and/or cancel tasks on exit.
 
@@ -194,13 +209,3 @@ class aclosing(Generic[V], AbstractAsyncContextManager):
     async def __aexit__(self, *exc_info):
         await self.thing.aclose()
 
-
-async def aclosing_aiter(aiter: AsyncIterator[T]) -> AsyncIterator[T]:
-    if hasattr(aiter, "__aenter__"):
-        async with aiter:
-            async for item in aiter:
-                yield item
-    else:
-        async with aclosing(aiter):
-            async for item in aiter:
-                yield item
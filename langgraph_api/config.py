@@ -54,6 +54,10 @@ STATS_INTERVAL_SECS = env("STATS_INTERVAL_SECS", cast=int, default=60)
 
 DATABASE_URI = env("DATABASE_URI", cast=str, default=getenv("POSTGRES_URI", undefined))
 MIGRATIONS_PATH = env("MIGRATIONS_PATH", cast=str, default="/storage/migrations")
+POSTGRES_POOL_MIN_SIZE = env("POSTGRES_POOL_MIN_SIZE", cast=int, default=1)
+"""Connections opened at startup, before the server accepts requests."""
+POSTGRES_POOL_MAX_SIZE = env("POSTGRES_POOL_MAX_SIZE", cast=int, default=150)
+POSTGRES_POOL_MAX_IDLE = env("POSTGRES_POOL_MAX_IDLE", cast=float, default=60)
 
 # redis
 REDIS_URI = env("REDIS_URI", cast=str)
@@ -115,6 +119,26 @@ else:
 if CORS_CONFIG is not None and CORS_ALLOW_ORIGINS != "*":
     raise ValueError("CORS_CONFIG and CORS_ALLOW_ORIGINS cannot be set together")
 
+# startup
+
+STARTUP_LICENSE_TIMEOUT = env("STARTUP_LICENSE_TIMEOUT", cast=float, default=10)
+STARTUP_HTTP_TIMEOUT = env("STARTUP_HTTP_TIMEOUT", cast=float, default=5)
+STARTUP_POOL_TIMEOUT = env("STARTUP_POOL_TIMEOUT", cast=float, default=None)
+"""Covers connecting to Postgres and Redis, and running migrations, so it is
+unbounded unless set: a migration cut short can't be resumed safely."""
+STARTUP_GRAPHS_TIMEOUT = env("STARTUP_GRAPHS_TIMEOUT", cast=float, default=None)
+GRAPH_LOAD_CONCURRENCY = env("GRAPH_LOAD_CONCURRENCY", cast=int, default=1)
+"""Graph modules loaded at once. User modules may not be safe to import
+concurrently, so raise this only for graphs known to be independent."""
+
+# shutdown
+
+SHUTDOWN_REMOTE_GRAPHS_TIMEOUT = env(
+    "SHUTDOWN_REMOTE_GRAPHS_TIMEOUT", cast=float, default=5
+)
+SHUTDOWN_HTTP_TIMEOUT = env("SHUTDOWN_HTTP_TIMEOUT", cast=float, default=2)
+SHUTDOWN_POOL_TIMEOUT = env("SHUTDOWN_POOL_TIMEOUT", cast=float, default=5)
+
 # queue
 
 BG_JOB_HEARTBEAT = 120  # seconds
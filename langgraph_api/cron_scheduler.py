@@ -4,9 +4,11 @@ from random import random
 import structlog
 from langchain_core.runnables.config import run_in_executor
 
+from langgraph_api import config
 from langgraph_api.models.run import create_valid_run
 from langgraph_api.queue import set_auth_ctx_for_run
 from langgraph_api.utils import next_cron_date
+from langgraph_license.validation import plus_features_enabled
 from langgraph_storage.database import connect
 from langgraph_storage.ops import Crons
 from langgraph_storage.retry import retry_db
@@ -14,12 +16,18 @@ from langgraph_storage.retry import retry_db
 logger = structlog.stdlib.get_logger(__name__)
 
 SLEEP_TIME = 5
+DISABLED_SLEEP_TIME = 60
 
 
 @retry_db
 async def cron_scheduler():
     logger.info("Starting cron scheduler")
     while True:
+        # checked on every tick, so a license upgrade takes effect without a
+        # restart
+        if not (config.FF_CRONS_ENABLED and plus_features_enabled()):
+            await asyncio.sleep(DISABLED_SLEEP_TIME)
+            continue
         try:
             async with connect() as conn:
                 async for cron in Crons.next(conn):
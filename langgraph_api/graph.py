@@ -21,6 +21,7 @@ from langgraph.pregel import Pregel
 from langgraph.store.base import BaseStore
 from starlette.exceptions import HTTPException
 
+from langgraph_api.config import GRAPH_LOAD_CONCURRENCY
 from langgraph_api.js.base import BaseRemotePregel
 from langgraph_api.schema import Config
 
@@ -115,7 +116,6 @@ async def get_graph(
 
 
 def graph_exists(graph_id: str) -> bool:
-    print('GRAPHS ', GRAPHS)
     """Return whether a graph exists."""
     return graph_id in GRAPHS
 
@@ -166,7 +166,6 @@ def is_js_spec(spec: GraphSpec) -> bool:
 def _load_graph_config_from_env() -> dict | None:
     """Return graph config from env."""
     config_str = os.getenv("LANGGRAPH_CONFIG")
-    print('config_str ', config_str)
     if not config_str:
         return None
 
@@ -182,7 +181,6 @@ async def collect_graphs_from_env(register: bool = False) -> None:
 
     paths_str = os.getenv("LANGSERVE_GRAPHS")
     config_per_graph = _load_graph_config_from_env() or {}
-    print('config_per_graph ', config_per_graph)
     if paths_str:
         specs = [
             (
@@ -202,7 +200,6 @@ async def collect_graphs_from_env(register: bool = False) -> None:
             )
             for key, value in json.loads(paths_str).items()
         ]
-        print('specs ', specs)
     else:
         specs = [
             GraphSpec(
@@ -214,7 +211,6 @@ async def collect_graphs_from_env(register: bool = False) -> None:
             )
             for graph_path in glob.glob("/graphs/*.py")
         ]
-        print('specs ', specs)
 
     js_specs = list(filter(is_js_spec, specs))
     py_specs = list(filterfalse(is_js_spec, specs))
@@ -257,13 +253,17 @@ async def collect_graphs_from_env(register: bool = False) -> None:
             if register:
                 await register_graph(spec.id, graph, spec.config)
 
-    for spec in py_specs:
-        print('_graph_from_spec ', _graph_from_spec)
-        graph = await run_in_executor(None, _graph_from_spec, spec)
-        print('graph ', graph)
+    # imports of user modules are I/O-heavy, so they may be loaded concurrently
+    # (opt-in), but are registered in spec order to keep GRAPHS deterministic
+    semaphore = asyncio.Semaphore(GRAPH_LOAD_CONCURRENCY)
+
+    async def load(spec: GraphSpec) -> GraphValue:
+        async with semaphore:
+            return await run_in_executor(None, _graph_from_spec, spec)
+
+    graphs = await asyncio.gather(*(load(spec) for spec in py_specs))
+    for spec, graph in zip(py_specs, graphs, strict=True):
         if register:
-            print('id ', spec.id)
-            print('spec config ', spec.config)
             await register_graph(spec.id, graph, spec.config)
 
 
@@ -1,20 +1,31 @@
-from contextlib import asynccontextmanager
+import asyncio
+import importlib.util
+from collections.abc import Awaitable, Callable
+from functools import partial
 
+import structlog
 from starlette.applications import Starlette
 
-import langgraph_api.config as config
-from langgraph_api.asyncio import SimpleTaskGroup
+from langgraph_api import config
+from langgraph_api.asyncio import SimpleTaskGroup, spawn_all
 from langgraph_api.cron_scheduler import cron_scheduler
 from langgraph_api.graph import collect_graphs_from_env, stop_remote_graphs
 from langgraph_api.http import start_http_client, stop_http_client
 from langgraph_api.metadata import metadata_loop
 from langgraph_api.queue import queue
-from langgraph_license.validation import get_license_status, plus_features_enabled
+from langgraph_api.startup import (
+    PRIORITY_CRITICAL,
+    PRIORITY_HIGH,
+    StartupRegistry,
+    timed,
+)
+from langgraph_license.validation import get_license_status
 from langgraph_storage.database import start_pool, stop_pool
 
+logger = structlog.stdlib.get_logger(__name__)
 
-@asynccontextmanager
-async def lifespan(app: Starlette):
+
+async def check_license() -> None:
     if not await get_license_status():
         raise ValueError(
             "License verification failed. Please ensure proper configuration:\n"
@@ -25,17 +36,119 @@ async def lifespan(app: Starlette):
             "Review your configuration settings and try again. If issues persist, "
             "contact support for assistance."
         )
-    await start_http_client()
-    await start_pool()
-    await collect_graphs_from_env(True)
+
+
+def check_event_loop() -> None:
+    """Warn when the server isn't running on uvloop.
+
+    The loop is created by uvicorn before the app is imported, so it can't be
+    switched from here; uvicorn's default loop setting picks uvloop if available."""
+    if type(asyncio.get_running_loop()).__module__.startswith("uvloop"):
+        return
+    if importlib.util.find_spec("uvloop") is None:
+        logger.warning("uvloop is not installed, using the slower asyncio event loop")
+    else:
+        logger.warning(
+            "uvloop is installed but not in use, run uvicorn with --loop uvloop"
+        )
+
+
+class Lifespan:
+    """Start the server's subsystems and background loops, and stop them again.
+
+    Starlette calls this with the app, and enters the result around the
+    lifetime of the server."""
+
+    def __init__(self, app: Starlette) -> None:
+        self.app = app
+        self.startup = StartupRegistry()
+        self.startup.register(
+            "license",
+            check_license,
+            priority=PRIORITY_CRITICAL,
+            timeout=config.STARTUP_LICENSE_TIMEOUT,
+        )
+        self.startup.register(
+            "http",
+            start_http_client,
+            priority=PRIORITY_HIGH,
+            timeout=config.STARTUP_HTTP_TIMEOUT,
+        )
+        # migrations can't safely be cut short, so don't start them until the
+        # license check, whose failure would cancel the rest of its level, passed
+        self.startup.register(
+            "pool",
+            start_pool,
+            deps=("license",),
+            priority=PRIORITY_HIGH,
+            timeout=config.STARTUP_POOL_TIMEOUT,
+        )
+        # registering graphs writes their assistants to the database
+        self.startup.register(
+            "graphs",
+            partial(collect_graphs_from_env, True),
+            deps=("pool",),
+            priority=PRIORITY_HIGH,
+            timeout=config.STARTUP_GRAPHS_TIMEOUT,
+        )
+        self.tg: SimpleTaskGroup | None = None
+        self.tasks: list[asyncio.Task] = []
+
+    async def __aenter__(self) -> None:
+        check_event_loop()
+        try:
+            await self.startup.run()
+            # failures of the loops are logged, not propagated: an error in one
+            # of them must not tear down the pool while the server keeps serving
+            self.tg = SimpleTaskGroup(cancel=True)
+            await self.tg.__aenter__()
+            self.tasks = spawn_all(
+                self.tg,
+                metadata_loop(),
+                queue(config.N_JOBS_PER_WORKER, config.BG_JOB_TIMEOUT_SECS),
+                # the scheduler checks whether crons are enabled on each tick
+                cron_scheduler(),
+            )
+        except BaseException:
+            await self.shutdown()
+            raise
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if self.tg is not None:
+                # cancels the loops, which never return on their own
+                await self.tg.__aexit__(exc_type, exc_value, traceback)
+        finally:
+            await self.shutdown()
+
+    async def shutdown(self) -> None:
+        # only stop what was started, so that errors from stopping subsystems
+        # which never came up can't mask the original startup error.
+        # stop_remote_graphs just cancels whatever js tasks were spawned.
+        stops = [
+            _stop(
+                "stop_remote_graphs",
+                stop_remote_graphs,
+                config.SHUTDOWN_REMOTE_GRAPHS_TIMEOUT,
+            )
+        ]
+        if "http" in self.startup.completed:
+            stops.append(
+                _stop(
+                    "stop_http_client", stop_http_client, config.SHUTDOWN_HTTP_TIMEOUT
+                )
+            )
+        if "pool" in self.startup.completed:
+            stops.append(_stop("stop_pool", stop_pool, config.SHUTDOWN_POOL_TIMEOUT))
+        # shut down independent subsystems together, and bound each of them, so
+        # a hanging one can't use up the grace period before the others ran
+        await asyncio.gather(*stops)
+
+
+async def _stop(step: str, func: Callable[[], Awaitable[None]], timeout: float) -> None:
     try:
-        async with SimpleTaskGroup(cancel=True) as tg:
-            tg.create_task(metadata_loop())
-            tg.create_task(queue(config.N_JOBS_PER_WORKER, config.BG_JOB_TIMEOUT_SECS))
-            if config.FF_CRONS_ENABLED and plus_features_enabled():
-                tg.create_task(cron_scheduler())
-            yield
-    finally:
-        await stop_remote_graphs()
-        await stop_http_client()
-        await stop_pool()
\ No newline at end of file
+        await timed(step, asyncio.wait_for(func(), timeout))
+    except TimeoutError:
+        logger.warning("Shutdown step timed out", step=step, timeout=timeout)
+    except Exception as exc:
+        logger.error("Shutdown step failed", step=step, exc_info=exc)
@@ -1,4 +1,3 @@
-import asyncio
 import uuid
 from collections.abc import Mapping, Sequence
 from typing import Any, NamedTuple, TypedDict
@@ -152,14 +151,13 @@ def get_user_id(user: BaseUser | None) -> str | None:
             pass
 
 
-async def create_valid_run(
-    conn: AsyncConnectionProto,
+def _prepare_run(
     thread_id: str | None,
     payload: RunCreateDict,
     headers: Mapping[str, str],
-    barrier: asyncio.Barrier | None = None,
     run_id: UUID | None = None,
-) -> Run:
+) -> dict[str, Any]:
+    """Validate a run payload, returning the keyword arguments for Runs.put."""
     (
         assistant_id,
         thread_id,
@@ -200,10 +198,9 @@ async def create_valid_run(
         config["configurable"]["langgraph_auth_permissions"] = ctx.permissions
     else:
         user_id = None
-    run_coro = Runs.put(
-        conn,
-        assistant_id,
-        {
+    return dict(
+        assistant_id=assistant_id,
+        kwargs={
             "input": payload.get("input"),
             "command": payload.get("command"),
             "config": config,
@@ -225,10 +222,20 @@ async def create_valid_run(
         after_seconds=payload.get("after_seconds", 0),
         if_not_exists=payload.get("if_not_exists", "reject"),
     )
-    run_ = await run_coro
 
-    if barrier:
-        await barrier.wait()
+
+async def create_valid_run(
+    conn: AsyncConnectionProto,
+    thread_id: str | None,
+    payload: RunCreateDict,
+    headers: Mapping[str, str],
+    run_id: UUID | None = None,
+) -> Run:
+    put_kwargs = _prepare_run(thread_id, payload, headers, run_id=run_id)
+    thread_id = put_kwargs["thread_id"]
+    run_id = put_kwargs["run_id"]
+    multitask_strategy = put_kwargs["multitask_strategy"]
+    run_ = await Runs.put(conn, **put_kwargs)
 
     # abort if thread, assistant, etc not found
     try:
@@ -264,6 +271,20 @@ async def create_valid_run(
         raise NotImplementedError
 
 
+async def create_valid_stateless_runs(
+    conn: AsyncConnectionProto,
+    payloads: Sequence[RunCreateDict],
+    headers: Mapping[str, str],
+) -> list[Run]:
+    """Create a batch of stateless runs with a single query."""
+    runs = await Runs.put_many(
+        conn,
+        [_prepare_run(None, payload, headers) for payload in payloads],
+    )
+    logger.info("Created runs", run_ids=[str(run["run_id"]) for run in runs])
+    return runs
+
+
 class _Ids(NamedTuple):
     assistant_id: uuid.UUID
     thread_id: uuid.UUID | None
@@ -45,7 +45,10 @@ def ms(after: datetime, before: datetime) -> int:
 
 async def queue(concurrency: int, timeout: float):
     loop = asyncio.get_running_loop()
-    last_stats_secs: int | None = None
+    # stats are first collected one interval in, to keep startup free of
+    # the aggregate query; the sweep still runs on the first tick
+    last_stats_secs: float = loop.time()
+    first_poll = True
     last_sweep_secs: int | None = None
     semaphore = asyncio.Semaphore(concurrency)
 
@@ -105,10 +108,7 @@ async def queue(concurrency: int, timeout: float):
                     or loop.time() - last_sweep_secs > BG_JOB_HEARTBEAT * 2
                 )
                 # check if we need to update stats
-                if calc_stats := (
-                    last_stats_secs is None
-                    or loop.time() - last_stats_secs > STATS_INTERVAL_SECS
-                ):
+                if calc_stats := loop.time() - last_stats_secs > STATS_INTERVAL_SECS:
                     last_stats_secs = loop.time()
                     active = len(WORKERS)
                     await logger.ainfo(
@@ -121,7 +121,8 @@ async def queue(concurrency: int, timeout: float):
                 await semaphore.acquire()
                 exit = AsyncExitStack()
                 # skip the wait, if 1st time, or got a run last time
-                wait = tup is None and last_stats_secs is not None
+                wait = tup is None and not first_poll
+                first_poll = False
                 # try to get a run, handle it
                 if tup := await exit.enter_async_context(Runs.next(wait=wait)):
                     run_, attempt_ = tup
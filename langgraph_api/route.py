@@ -7,6 +7,7 @@ import orjson
 from starlette._exception_handler import wrap_app_handling_exceptions
 from starlette._utils import is_async_callable
 from starlette.concurrency import run_in_threadpool
+from starlette.convertors import Convertor, register_url_convertor
 from starlette.middleware import Middleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
@@ -17,6 +18,25 @@ from langgraph_api.serde import json_dumpb
 from langgraph_api.utils import get_auth_ctx, with_user
 
 
+class UUIDConvertor(Convertor[str]):
+    """Match canonical UUIDs at routing time, keeping them as strings.
+
+    Starlette's builtin "uuid" convertor yields `uuid.UUID` objects and only
+    matches lowercase hex, so this one is registered under its own name to
+    leave custom user apps relying on the builtin untouched."""
+
+    regex = "[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+
+    def convert(self, value: str) -> str:
+        return value
+
+    def to_string(self, value: str) -> str:
+        return str(value)
+
+
+register_url_convertor("uuid_str", UUIDConvertor())
+
+
 def api_request_response(
     func: typing.Callable[[Request], typing.Awaitable[Response] | Response],
 ) -> ASGIApp:
@@ -45,6 +65,11 @@ class ApiResponse(JSONResponse):
         return json_dumpb(content)
 
 
+# Bodies up to this size are parsed and validated on the event loop, where
+# that is cheaper than the round-trip to the threadpool.
+JSON_INLINE_MAX_BYTES = 64 * 1024
+
+
 def _json_loads(
     content: bytearray, schema: jsonschema_rs.Draft4Validator | None
 ) -> typing.Any:
@@ -66,7 +91,10 @@ class ApiRequest(Request):
     async def json(self, schema: jsonschema_rs.Draft4Validator | None) -> typing.Any:
         if not hasattr(self, "_json"):
             body = await self.body()
-            self._json = await run_in_threadpool(_json_loads, body, schema)
+            if len(body) <= JSON_INLINE_MAX_BYTES:
+                self._json = _json_loads(body, schema)
+            else:
+                self._json = await run_in_threadpool(_json_loads, body, schema)
         return self._json
 
 
@@ -115,7 +143,7 @@ class ApiRoute(Route):
 
     async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
         # https://asgi.readthedocs.io/en/latest/specs/www.html#http-connection-scope
-        scope["route"] = self.path
+        scope["route"] = self.path_format
         ctx = get_auth_ctx()
         if ctx:
             user, auth = ctx.user, ctx.permissions
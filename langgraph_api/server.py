@@ -22,7 +22,7 @@ from langgraph_api.errors import (
     validation_error_handler,
     value_error_handler,
 )
-from langgraph_api.lifespan import lifespan
+from langgraph_api.lifespan import Lifespan
 from langgraph_api.middleware.http_logger import AccessLoggerMiddleware
 from langgraph_api.middleware.private_network import PrivateNetworkMiddleware
 from langgraph_api.utils import SchemaGenerator
@@ -111,7 +111,7 @@ if user_router:
 
     @asynccontextmanager
     async def combined_lifespan(app):
-        async with lifespan(app):
+        async with Lifespan(app):
             if original_lifespan:
                 async with original_lifespan(app):
                     yield
@@ -136,7 +136,7 @@ else:
     # It's a regular starlette app
     app = Starlette(
         routes=routes,
-        lifespan=lifespan,
+        lifespan=Lifespan,
         middleware=middleware,
         exception_handlers=exception_handlers,
     )
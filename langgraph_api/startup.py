@@ -0,0 +1,127 @@
+"""Startup steps declared with their dependencies, run concurrently where the
+dependencies allow."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, NamedTuple, TypeVar
+
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+T = TypeVar("T")
+
+# only a tie-breaker for the order steps of the same level are started in; it
+# doesn't delay lower-priority steps, which still run concurrently
+PRIORITY_CRITICAL = 2
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 0
+
+
+async def timed(
+    step: str, coro: Awaitable[T], timings: dict[str, float] | None = None
+) -> T:
+    """Await `coro`, logging how long it took, and recording it in `timings`."""
+    start = time.perf_counter()
+    try:
+        return await coro
+    finally:
+        ms = (time.perf_counter() - start) * 1000
+        if timings is not None:
+            timings[step] = ms
+        logger.info("lifespan.step", step=step, ms=round(ms, 1))
+
+
+class StartupStep(NamedTuple):
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    deps: tuple[str, ...]
+    priority: int
+    timeout: float | None
+
+
+class StartupRegistry:
+    """A set of startup steps and the dependencies between them.
+
+    Steps are run in topological levels: all steps of a level run concurrently,
+    once every step of the previous levels has completed. Priority only breaks
+    ties: within a level, steps are started highest first, but none of them
+    waits for another. A step that fails or times out cancels the rest of its
+    level and aborts startup, raising the step's own exception."""
+
+    def __init__(self) -> None:
+        self.steps: dict[str, StartupStep] = {}
+        self.timings: dict[str, float] = {}
+        self.completed: set[str] = set()
+        """Names of the steps that finished successfully."""
+
+    def register(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        *,
+        deps: Sequence[str] = (),
+        priority: int = PRIORITY_NORMAL,
+        timeout: float | None = None,
+    ) -> None:
+        if name in self.steps:
+            raise ValueError(f"Startup step '{name}' is already registered")
+        self.steps[name] = StartupStep(name, func, tuple(deps), priority, timeout)
+
+    def levels(self) -> list[list[StartupStep]]:
+        """Group the steps into levels, each depending only on earlier ones."""
+        remaining = dict(self.steps)
+        done: set[str] = set()
+        levels: list[list[StartupStep]] = []
+        while remaining:
+            level = [
+                step
+                for step in remaining.values()
+                if all(dep in done for dep in step.deps)
+            ]
+            if not level:
+                raise ValueError(
+                    "Startup steps have missing or circular dependencies: "
+                    f"{', '.join(sorted(remaining))}"
+                )
+            level.sort(key=lambda step: step.priority, reverse=True)
+            for step in level:
+                del remaining[step.name]
+                done.add(step.name)
+            levels.append(level)
+        return levels
+
+    async def _run_step(self, step: StartupStep) -> None:
+        try:
+            await timed(
+                step.name, asyncio.wait_for(step.func(), step.timeout), self.timings
+            )
+            self.completed.add(step.name)
+        except TimeoutError:
+            logger.error(
+                "Startup step timed out", step=step.name, timeout=step.timeout
+            )
+            raise
+
+    async def run(self) -> None:
+        start = time.perf_counter()
+        for level in self.levels():
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    for step in level:
+                        tg.create_task(
+                            self._run_step(step), name=f"startup-{step.name}"
+                        )
+            except BaseExceptionGroup as eg:
+                # the rest of the level is cancelled on the first failure, so
+                # there is usually just one; raise it as is for the caller
+                if len(eg.exceptions) == 1:
+                    raise eg.exceptions[0] from None
+                raise
+        logger.info(
+            "Startup steps completed",
+            ms=round((time.perf_counter() - start) * 1000, 1),
+            timings_ms={name: round(ms, 1) for name, ms in self.timings.items()},
+            slowest=max(self.timings, key=self.timings.__getitem__, default=None),
+        )
@@ -1,4 +1,5 @@
 import contextvars
+import re
 import uuid
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -91,9 +92,18 @@ async def fetchone(
         ) from None
 
 
-def validate_uuid(uuid_str: str, invalid_uuid_detail: str | None) -> uuid.UUID:
+_is_canonical_uuid = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+).fullmatch
+
+
+def validate_uuid(uuid_str: str, invalid_uuid_detail: str | None) -> None:
+    # fast path for the canonical hyphenated form, falling back to uuid.UUID
+    # for the other spellings it accepts (no hyphens, braces, urn:uuid:)
+    if _is_canonical_uuid(uuid_str) is not None:
+        return
     try:
-        return uuid.UUID(uuid_str)
+        uuid.UUID(uuid_str)
     except ValueError:
         raise HTTPException(status_code=422, detail=invalid_uuid_detail) from None
 
@@ -15,7 +15,6 @@ from langgraph.checkpoint.base import (
 )
 from langgraph.constants import TASKS
 from langgraph.errors import EmptyChannelError
-from langgraph_api.asyncio import aclosing_aiter
 from langgraph_api.schema import MetadataInput
 from langgraph_api.serde import Fragment, Serializer, ajson_loads, json_loads
 from psycopg import AsyncConnection
@@ -129,35 +128,37 @@ class Checkpointer(BaseCheckpointSaver):
             binary=True,
         )
 
-        return (
-            CheckpointTuple(
-                {
-                    "configurable": {
-                        "thread_id": thread_id,
-                        "checkpoint_ns": value["checkpoint_ns"],
-                        "checkpoint_id": value["checkpoint_id"],
-                    }
-                },
-                await asyncio.to_thread(
-                    self._load_checkpoint,
-                    value["checkpoint"],
-                    value["channel_values"],
-                    value["pending_sends"],
-                ),
-                await ajson_loads(value["metadata"]),
-                {
-                    "configurable": {
-                        "thread_id": thread_id,
-                        "checkpoint_ns": value["checkpoint_ns"],
-                        "checkpoint_id": value["parent_checkpoint_id"],
-                    }
-                }
-                if value["parent_checkpoint_id"]
-                else None,
-                await asyncio.to_thread(self._load_writes, value["pending_writes"]),
-            )
-            async for value in aclosing_aiter(cur)
-        )
+        async def consume() -> AsyncIterator[CheckpointTuple]:
+            async with cur:
+                async for value in cur:
+                    yield CheckpointTuple(
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": value["checkpoint_ns"],
+                                "checkpoint_id": value["checkpoint_id"],
+                            }
+                        },
+                        await asyncio.to_thread(
+                            self._load_checkpoint,
+                            value["checkpoint"],
+                            value["channel_values"],
+                            value["pending_sends"],
+                        ),
+                        await ajson_loads(value["metadata"]),
+                        {
+                            "configurable": {
+                                "thread_id": thread_id,
+                                "checkpoint_ns": value["checkpoint_ns"],
+                                "checkpoint_id": value["parent_checkpoint_id"],
+                            }
+                        }
+                        if value["parent_checkpoint_id"]
+                        else None,
+                        await asyncio.to_thread(self._load_writes, value["pending_writes"]),
+                    )
+
+        return consume()
 
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         if self.latest_iter is not None:
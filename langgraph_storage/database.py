@@ -84,9 +84,9 @@ def create_pool(
         pool_max_size = 10
         pool_max_idle = 30
     else:
-        pool_min_size = 1
-        pool_max_size = 150
-        pool_max_idle = 60
+        pool_min_size = config.POSTGRES_POOL_MIN_SIZE
+        pool_max_size = config.POSTGRES_POOL_MAX_SIZE
+        pool_max_idle = config.POSTGRES_POOL_MAX_IDLE
 
     # create connection pool
     return AsyncConnectionPool(
@@ -186,21 +186,16 @@ async def migrate_vector_index():
 
 async def start_pool() -> None:
     global _pg_pool, _stats_task
-    print('1')
+
     _pg_pool = create_pool()
-    print('2')
-    # confirm connectivity
+    # confirm connectivity, and warm up the pool: this waits until min_size
+    # connections are open, so the first requests don't pay for connecting
     await _pg_pool.open(wait=True)
-    print('3')
     # migrate database
     await migrate()
-    print('4')
     await migrate_vector_index()
-
-    print('5')
     # start stats loop
     _stats_task = asyncio.create_task(stats_loop())
-    print('6')
     # start redis
     await start_redis()
 
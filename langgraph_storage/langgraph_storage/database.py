@@ -84,9 +84,9 @@ def create_pool(
         pool_max_size = 10
         pool_max_idle = 30
     else:
-        pool_min_size = 1
-        pool_max_size = 150
-        pool_max_idle = 60
+        pool_min_size = config.POSTGRES_POOL_MIN_SIZE
+        pool_max_size = config.POSTGRES_POOL_MAX_SIZE
+        pool_max_idle = config.POSTGRES_POOL_MAX_IDLE
 
     # create connection pool
     return AsyncConnectionPool(
@@ -185,7 +185,8 @@ async def start_pool() -> None:
     global _pg_pool, _stats_task
 
     _pg_pool = create_pool()
-    # confirm connectivity
+    # confirm connectivity, and warm up the pool: this waits until min_size
+    # connections are open, so the first requests don't pay for connecting
     await _pg_pool.open(wait=True)
     # migrate database
     await migrate()
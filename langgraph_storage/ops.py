@@ -573,6 +573,73 @@ class Threads(Authenticated):
         cur = await conn.execute(query, params, binary=True)
         return (row async for row in cur)
 
+    @staticmethod
+    async def get_with_runs(
+        conn: AsyncConnection[DictRow],
+        thread_id: UUID,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        status: RunStatus | None = None,
+        ctx: Auth.types.BaseAuthContext | None = None,
+    ) -> AsyncIterator[Run]:
+        """List the runs of a thread in a single query, raising 404 if the
+        thread does not exist."""
+        read_filters = await Threads.handle_event(
+            ctx,
+            "read",
+            Auth.types.ThreadsRead(thread_id=thread_id),
+        )
+        search_filters = await Runs.handle_event(
+            ctx,
+            "search",
+            Auth.types.ThreadsSearch(thread_id=thread_id, metadata={}),
+        )
+        read_clause, read_params = _build_filter_query(
+            filters=read_filters, table_alias="thread"
+        )
+        search_clause, search_params = _build_filter_query(
+            filters=search_filters,
+            table_alias="thread",
+            start=len(read_filters or {}),
+        )
+        status_clause = "AND run.status = %(status)s::text" if status else ""
+
+        # One row per run, or a single all-NULL run row if the thread has none.
+        # No rows at all means the thread doesn't exist (or isn't visible).
+        query = f"""SELECT run.*
+        FROM thread
+        LEFT JOIN LATERAL (
+            SELECT * FROM run
+            WHERE run.thread_id = thread.thread_id {status_clause}
+            ORDER BY run.created_at DESC
+            LIMIT %(limit)s OFFSET %(offset)s
+        ) run ON true
+        WHERE thread.thread_id = %(thread_id)s {read_clause} {search_clause}
+        ORDER BY run.created_at DESC"""
+        params = {
+            **read_params,
+            **search_params,
+            "thread_id": thread_id,
+            "status": status,
+            "limit": limit,
+            "offset": offset,
+        }
+
+        cur = await conn.execute(query, params, binary=True)
+        first = await cur.fetchone()
+        if first is None:
+            raise HTTPException(status_code=404, detail="Thread not found")
+
+        async def consume() -> AsyncIterator[Run]:
+            if first["run_id"] is None:
+                return
+            yield first
+            async for row in cur:
+                yield row
+
+        return consume()
+
     @staticmethod
     async def put(
         conn: AsyncConnection[DictRow],
@@ -1178,17 +1245,7 @@ class Runs(Authenticated):
                 SELECT
                     %(thread_id)s,
                     'busy',
-                    jsonb_build_object(
-                        'graph_id', assistant.graph_id,
-                        'assistant_id', assistant.assistant_id
-                    ) || %(metadata)s::jsonb,
-                    assistant.config
-                    || %(config)s::jsonb
-                    || jsonb_build_object(
-                        'configurable',
-                            coalesce((assistant.config -> 'configurable'), '{{}}') ||
-                            coalesce(%(config)s::jsonb -> 'configurable', '{{}}')
-                       )
+                    {_new_thread_sql(metadata="%(metadata)s::jsonb", config="%(config)s::jsonb")}
                 FROM assistant
                 WHERE assistant_id = %(assistant_id)s
                 ON CONFLICT (thread_id) DO NOTHING
@@ -1239,28 +1296,13 @@ inserted_run AS (
         assistant_id,
         %(metadata)s,
         %(status)s,
-        %(kwargs)s::jsonb || jsonb_build_object(
-            'config', assistant.config || run_thread.config || %(config)s::jsonb || jsonb_build_object(
-                'configurable',
-                    coalesce((assistant.config -> 'configurable'), '{{}}') ||
-                    coalesce((run_thread.config -> 'configurable'), '{{}}') ||
-                    coalesce(%(config)s::jsonb -> 'configurable', '{{}}') ||
-                    jsonb_build_object(
-                        'run_id', %(run_id)s::text,
-                        'thread_id', thread_id,
-                        'graph_id', graph_id,
-                        'assistant_id', assistant_id,
-                        'user_id', coalesce(
-                            %(config)s::jsonb -> 'configurable' ->> 'user_id',
-                            run_thread.config -> 'configurable' ->> 'user_id',
-                            assistant.config -> 'configurable' ->> 'user_id',
-                            %(user_id)s::text
-                        )
-                    ),
-                'metadata',
-                    assistant.metadata || run_thread.metadata || %(metadata)s
-            )
-        ),
+        {_run_kwargs_sql(
+            kwargs="%(kwargs)s::jsonb",
+            config="%(config)s::jsonb",
+            metadata="%(metadata)s",
+            run_id="%(run_id)s::text",
+            user_id="%(user_id)s::text",
+        )},
         %(multitask_strategy)s,
         now() + %(after_seconds)s::interval
     FROM run_thread
@@ -1319,6 +1361,122 @@ SELECT * FROM inflight_runs"""
 
         return consume()
 
+    @staticmethod
+    async def put_many(
+        conn: AsyncConnection[DictRow],
+        runs: Sequence[dict[str, Any]],
+        ctx: Auth.types.BaseAuthContext | None = None,
+    ) -> list[Run]:
+        """Create a batch of runs, each on a new thread, with a single query.
+
+        Each item holds the keyword arguments that `Runs.put` accepts, with
+        `thread_id` left unset. Raises 404 (creating no runs) if any
+        assistant is not found."""
+        params = []
+        for run in runs:
+            metadata = run.get("metadata") or {}
+            metadata.setdefault("assistant_id", run["assistant_id"])
+            kwargs = run.get("kwargs") or {}
+            kwargs.setdefault("config", {})
+            run_id = run.get("run_id") or uuid6()
+            after_seconds = run.get("after_seconds") or 0
+            multitask_strategy = run.get("multitask_strategy", "reject")
+            # new threads have no filters to apply, but handlers may still reject
+            await Runs.handle_event(
+                ctx,
+                "create_run",
+                Auth.types.RunsCreate(
+                    thread_id=None,
+                    assistant_id=run["assistant_id"],
+                    run_id=run_id,
+                    status=run.get("status", "pending"),
+                    metadata=metadata,
+                    prevent_insert_if_inflight=run.get(
+                        "prevent_insert_if_inflight", False
+                    ),
+                    multitask_strategy=multitask_strategy,
+                    if_not_exists="create",
+                    after_seconds=after_seconds,
+                    kwargs=kwargs,
+                ),
+            )
+            params.append(
+                {
+                    "run_id": run_id,
+                    "thread_id": uuid4(),
+                    "assistant_id": run["assistant_id"],
+                    "metadata": metadata,
+                    "kwargs": kwargs,
+                    "status": run.get("status", "pending"),
+                    "user_id": run.get("user_id"),
+                    "multitask_strategy": multitask_strategy,
+                    "after_seconds": after_seconds,
+                }
+            )
+
+        query = f"""
+WITH input AS (
+    SELECT * FROM jsonb_to_recordset(%(runs)s::jsonb) AS input(
+        run_id uuid,
+        thread_id uuid,
+        assistant_id uuid,
+        metadata jsonb,
+        kwargs jsonb,
+        status text,
+        user_id text,
+        multitask_strategy text,
+        after_seconds int
+    )
+),
+
+inserted_thread AS (
+    INSERT INTO thread (thread_id, status, metadata, config)
+    SELECT
+        input.thread_id,
+        'busy',
+        {_new_thread_sql(metadata="input.metadata", config="(input.kwargs -> 'config')")}
+    FROM input
+    JOIN assistant ON assistant.assistant_id = input.assistant_id
+    RETURNING *
+)
+
+INSERT INTO run (run_id, thread_id, assistant_id, metadata, status, kwargs, multitask_strategy, created_at)
+SELECT
+    input.run_id,
+    input.thread_id,
+    input.assistant_id,
+    input.metadata,
+    input.status,
+    {_run_kwargs_sql(
+        kwargs="input.kwargs",
+        config="(input.kwargs -> 'config')",
+        metadata="input.metadata",
+        run_id="input.run_id::text",
+        user_id="input.user_id",
+    )},
+    input.multitask_strategy,
+    now() + make_interval(secs => input.after_seconds)
+FROM input
+JOIN inserted_thread run_thread ON run_thread.thread_id = input.thread_id
+JOIN assistant ON assistant.assistant_id = input.assistant_id
+RETURNING run.*"""
+
+        async with conn.transaction():
+            cur = await conn.execute(query, {"runs": Jsonb(params)}, binary=True)
+            rows = {row["run_id"]: row async for row in cur}
+            if len(rows) < len(params):
+                # roll back the whole batch
+                raise HTTPException(status_code=404, detail="Assistant not found.")
+
+        # notify queue, once per run ready to start
+        if n_now := sum(1 for p in params if not p["after_seconds"]):
+            await get_redis().lpush(LIST_RUN_QUEUE, [1] * n_now)
+        for p in params:
+            if p["after_seconds"]:
+                create_task(wake_up_worker(p["after_seconds"]))
+
+        return [rows[p["run_id"]] for p in params]
+
     @staticmethod
     async def get(
         conn: AsyncConnection[DictRow],
@@ -1609,10 +1767,12 @@ SELECT * FROM inflight_runs"""
             run_id: UUID,
             *,
             stream_mode: StreamMode | None = None,
+            pubsub: StreamHandler | None = None,
         ) -> StreamHandler:
             """Subscribe to the run stream, returning a stream handler.
             The stream handler must be passed to `join` to receive messages."""
-            pubsub = get_pubsub()
+            if pubsub is None:
+                pubsub = get_pubsub()
             control_channel = CHANNEL_RUN_CONTROL.format(run_id)
             if stream_mode is None:
                 await pubsub.psubscribe(
@@ -1624,6 +1784,16 @@ SELECT * FROM inflight_runs"""
                 )
             return pubsub
 
+        @staticmethod
+        def prearm(
+            run_id: UUID,
+            *,
+            stream_mode: StreamMode | None = None,
+        ) -> "StreamSubscription":
+            """Start subscribing to the run stream before the run is created,
+            so that no events are missed once a worker picks it up."""
+            return StreamSubscription(run_id, stream_mode=stream_mode)
+
         @staticmethod
         async def join(
             run_id: UUID,
@@ -1631,10 +1801,17 @@ SELECT * FROM inflight_runs"""
             thread_id: UUID,
             ignore_404: bool = False,
             cancel_on_disconnect: bool = False,
-            stream_mode: StreamMode | StreamHandler | None = None,
+            stream_mode: "StreamMode | StreamHandler | StreamSubscription | None" = None,
             ctx: Auth.types.BaseAuthContext | None = None,
         ) -> AsyncIterator[tuple[bytes, bytes]]:
-            """Stream the run output, either from a stream handler or a stream mode."""
+            """Stream the run output, either from a stream handler, a pending
+            subscription from `prearm`, or a stream mode."""
+            if isinstance(stream_mode, StreamSubscription):
+                try:
+                    stream_mode = await stream_mode.finalize()
+                except BaseException:
+                    stream_mode.cancel()
+                    raise
             filters = await Runs.Stream.handle_event(
                 ctx,
                 "read",
@@ -1731,6 +1908,27 @@ SELECT * FROM inflight_runs"""
         ) -> None:
             await get_redis().publish(CHANNEL_RUN_STREAM.format(run_id, event), message)
 
+
+class StreamSubscription:
+    """A run stream subscription, started in the background by
+    `Runs.Stream.prearm` while the run is being created."""
+
+    def __init__(self, run_id: UUID, *, stream_mode: StreamMode | None = None):
+        self.pubsub = get_pubsub()
+        self._task = asyncio.create_task(
+            Runs.Stream.subscribe(run_id, stream_mode=stream_mode, pubsub=self.pubsub)
+        )
+
+    async def finalize(self) -> StreamHandler:
+        """Wait for the subscription, returning the handler to pass to `join`."""
+        return await self._task
+
+    def cancel(self) -> None:
+        """Abandon the subscription, eg. if the run could not be created."""
+        self._task.cancel()
+        self._task.add_done_callback(lambda _: self.pubsub.close())
+
+
 class Crons(Authenticated):
     resource = "crons"
 
@@ -2001,9 +2199,6 @@ LIMIT 1
 
         cur = await conn.execute(query, params, binary=True)
         result = [row async for row in cur]
-        all_results = []
-        async for r in await conn.execute("SELECT * FROM cron WHERE 1 = 1"):
-            all_results.append(r)
 
         async def consume():
             for row in result:
@@ -2063,6 +2258,52 @@ async def wake_up_worker(delay: float = 0) -> None:
     await get_redis().lpush(LIST_RUN_QUEUE, [1])
 
 
+def _new_thread_sql(*, metadata: str, config: str) -> str:
+    """SQL for the metadata and config columns of a thread created for a run on
+    `assistant`, given SQL expressions for the run's metadata and config."""
+    return f"""jsonb_build_object(
+        'graph_id', assistant.graph_id,
+        'assistant_id', assistant.assistant_id
+    ) || {metadata},
+    assistant.config
+    || {config}
+    || jsonb_build_object(
+        'configurable',
+            coalesce((assistant.config -> 'configurable'), '{{}}') ||
+            coalesce({config} -> 'configurable', '{{}}')
+    )"""
+
+
+def _run_kwargs_sql(
+    *, kwargs: str, config: str, metadata: str, run_id: str, user_id: str
+) -> str:
+    """SQL for the kwargs of a run of `assistant` on `run_thread`, merging the
+    assistant's, thread's and run's config, given SQL expressions for the
+    run's own fields."""
+    return f"""{kwargs} || jsonb_build_object(
+        'config', assistant.config || run_thread.config || {config} || jsonb_build_object(
+            'configurable',
+                coalesce((assistant.config -> 'configurable'), '{{}}') ||
+                coalesce((run_thread.config -> 'configurable'), '{{}}') ||
+                coalesce({config} -> 'configurable', '{{}}') ||
+                jsonb_build_object(
+                    'run_id', {run_id},
+                    'thread_id', run_thread.thread_id,
+                    'graph_id', assistant.graph_id,
+                    'assistant_id', assistant.assistant_id,
+                    'user_id', coalesce(
+                        {config} -> 'configurable' ->> 'user_id',
+                        run_thread.config -> 'configurable' ->> 'user_id',
+                        assistant.config -> 'configurable' ->> 'user_id',
+                        {user_id}
+                    )
+                ),
+            'metadata',
+                assistant.metadata || run_thread.metadata || {metadata}
+        )
+    )"""
+
+
 def _build_filter_query(
     *,
     filters: Auth.types.FilterType | None,
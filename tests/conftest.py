@@ -0,0 +1,12 @@
+import os
+
+import pytest
+
+# langgraph_api.config reads these at import time
+os.environ.setdefault("DATABASE_URI", "postgres://localhost:5432/postgres")
+os.environ.setdefault("REDIS_URI", "redis://localhost:6379")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
@@ -0,0 +1,63 @@
+import jsonschema_rs
+import orjson
+import pytest
+
+from langgraph_api import route
+from langgraph_api.route import JSON_INLINE_MAX_BYTES, ApiRequest
+
+SCHEMA = jsonschema_rs.Draft4Validator(
+    {"type": "object", "properties": {"data": {"type": "string"}}}
+)
+
+
+def make_request(body: bytes) -> ApiRequest:
+    messages = [
+        {"type": "http.request", "body": body[:1024], "more_body": len(body) > 1024},
+        {"type": "http.request", "body": body[1024:], "more_body": False},
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": []}
+    return ApiRequest(scope, receive)
+
+
+@pytest.fixture
+def threadpool_calls(monkeypatch):
+    calls = []
+    run_in_threadpool = route.run_in_threadpool
+
+    async def recording(func, *args):
+        calls.append(func)
+        return await run_in_threadpool(func, *args)
+
+    monkeypatch.setattr(route, "run_in_threadpool", recording)
+    return calls
+
+
+@pytest.mark.anyio
+async def test_json_small_body_parsed_inline(threadpool_calls):
+    payload = {"data": "x"}
+    request = make_request(orjson.dumps(payload))
+
+    assert await request.json(SCHEMA) == payload
+    assert threadpool_calls == []
+
+
+@pytest.mark.anyio
+async def test_json_large_body_parsed_in_threadpool(threadpool_calls):
+    payload = {"data": "x" * JSON_INLINE_MAX_BYTES}
+    request = make_request(orjson.dumps(payload))
+
+    assert await request.json(SCHEMA) == payload
+    assert len(threadpool_calls) == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("size", [16, JSON_INLINE_MAX_BYTES + 1])
+async def test_json_invalid_body_raises(size):
+    request = make_request(orjson.dumps({"data": 1, "pad": "x" * size}))
+
+    with pytest.raises(jsonschema_rs.ValidationError):
+        await request.json(SCHEMA)